@@ -4,7 +4,7 @@ Quick utility to examine the Kaggle dataset structure and contents.
 Run this first to verify your dataset before running the ranker.
 """
 
-import pandas as pd
+from loader import load, numeric_columns
 
 def inspect_dataset():
     """Inspect the travel dataset and display key information."""
@@ -14,7 +14,7 @@ def inspect_dataset():
     print("[OK] Dataset found! Loading...\n")
     
     # Load dataset
-    df = pd.read_csv(dataset_path)
+    df = load(dataset_path)
     
     # Basic info
     print("="*70)
@@ -65,8 +65,9 @@ def inspect_dataset():
     print("="*70)
     rating_cols = [col for col in df.columns if 'rating' in col.lower() or 'significance' in col.lower()]
     if rating_cols:
+        numeric_cols = numeric_columns(dataset_path)
         for col in rating_cols:
-            if pd.api.types.is_numeric_dtype(df[col]):
+            if col in numeric_cols:
                 print(f"\n{col}:")
                 print(f"  Min: {df[col].min()}")
                 print(f"  Max: {df[col].max()}")
@@ -81,12 +82,12 @@ def inspect_dataset():
     print("="*70)
     
     if 'City' in df.columns:
-        cities = sorted(df['City'].dropna().unique().tolist())
-        print(f"Found {len(cities)} unique cities:")
+        # One hash aggregation instead of a substring scan per city
+        city_counts = df['City'].value_counts(dropna=True).sort_index()
+        print(f"Found {len(city_counts)} unique cities:")
         print("-" * 40)
         
-        for city in cities:
-            count = df[df['City'].str.contains(city, case=False, na=False)].shape[0]
+        for city, count in city_counts.items():
             print(f"[OK] {city}: {count} destinations")
     else:
         print("[ERROR] 'City' column not found in dataset")
@@ -0,0 +1,85 @@
+"""
+Dataset Loader
+Shared loading of the Kaggle dataset for inspect_dataset.py and ranker.py.
+The parsed CSV is cached as a sibling .parquet file on disk and memoized in-process,
+along with the dataset's numeric columns.
+"""
+
+import contextlib
+import functools
+import os
+import tempfile
+
+import pandas as pd
+
+# Known columns and their dtypes.
+# Low-cardinality text columns are categorical so comparisons and grouping use integer codes.
+DATASET_COLUMNS = {
+    'Name': 'str',
+    'City': 'category',
+    'State': 'category',
+    'Type': 'category',
+    'Google review rating': 'float64',
+}
+
+def _read_cache(parquet_path: str, filepath: str):
+    """
+    Return the cached dataset, or None when the cache is missing, older than
+    the CSV, unreadable, or written with different columns or dtypes.
+    """
+    try:
+        if not os.path.exists(parquet_path) or os.path.getmtime(parquet_path) < os.path.getmtime(filepath):
+            return None
+        df = pd.read_parquet(parquet_path, engine='pyarrow')
+    except (OSError, ValueError, ImportError):
+        # Truncated or corrupt file, or pyarrow unavailable: reparse the CSV
+        return None
+
+    # Header-only read gives the CSV's columns and the dtypes we would load them with
+    expected = pd.read_csv(filepath, nrows=0, dtype=DATASET_COLUMNS)
+    if list(df.columns) != list(expected.columns):
+        return None
+    for col in DATASET_COLUMNS:
+        if col in df.columns and df[col].dtype.name != expected[col].dtype.name:
+            return None
+    return df
+
+def _write_cache(df: pd.DataFrame, parquet_path: str):
+    """Write the Parquet cache atomically; failures leave loading from the CSV unaffected."""
+    directory = os.path.dirname(parquet_path) or '.'
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp.parquet')
+        os.close(fd)
+        df.to_parquet(tmp_path, engine='pyarrow', index=False)
+        # mkstemp creates the file owner-only; give the cache the usual umask-based mode
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        # Readers only ever see the old cache or the complete new one
+        os.replace(tmp_path, parquet_path)
+    except (OSError, ValueError, ImportError):
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
+@functools.lru_cache(maxsize=1)
+def load(filepath: str) -> pd.DataFrame:
+    """
+    Load the full dataset.
+    Reads the sibling .parquet cache when it is current and matches the CSV's
+    columns and dtypes; otherwise parses the CSV and (best effort) rewrites the cache.
+    The returned frame is shared between callers, so treat it as read-only.
+    """
+    parquet_path = os.path.splitext(filepath)[0] + '.parquet'
+    df = _read_cache(parquet_path, filepath)
+    if df is None:
+        df = pd.read_csv(filepath, dtype=DATASET_COLUMNS)
+        _write_cache(df, parquet_path)
+
+    return df
+
+@functools.lru_cache(maxsize=1)
+def numeric_columns(filepath: str) -> frozenset:
+    """Names of the numeric columns of the dataset returned by load(filepath)."""
+    return frozenset(load(filepath).select_dtypes(include='number').columns)
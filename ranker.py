@@ -4,11 +4,14 @@ Ranks destinations based on weekend suitability using only dataset fields.
 No fabricated data - all logic derived from available columns.
 """
 
+import numpy as np
 import pandas as pd
 import os
 
+from loader import DATASET_COLUMNS, load, numeric_columns
+
 # State proximity mapping (neighboring states for geographic approximation)
-STATE_NEIGHBORS = {
+_STATE_NEIGHBOR_LISTS = {
     'Delhi': ['Haryana', 'Uttar Pradesh', 'Rajasthan', 'Punjab'],
     'Maharashtra': ['Gujarat', 'Madhya Pradesh', 'Karnataka', 'Goa', 'Telangana'],
     'Karnataka': ['Maharashtra', 'Goa', 'Tamil Nadu', 'Andhra Pradesh', 'Telangana', 'Kerala'],
@@ -21,6 +24,14 @@ STATE_NEIGHBORS = {
     'Goa': ['Maharashtra', 'Karnataka'],
 }
 
+# Symmetric adjacency: a listed border counts from both sides, and membership is O(1)
+STATE_NEIGHBORS = {
+    state: frozenset(_STATE_NEIGHBOR_LISTS.get(state, [])).union(
+        other for other, neighbors in _STATE_NEIGHBOR_LISTS.items() if state in neighbors
+    )
+    for state in set(_STATE_NEIGHBOR_LISTS).union(*_STATE_NEIGHBOR_LISTS.values())
+}
+
 # Weekend-friendly categories (short trips, accessible)
 WEEKEND_CATEGORIES = {
     'Hill Station': 1.0,
@@ -38,16 +49,34 @@ WEEKEND_CATEGORIES = {
 
 def load_dataset(filepath: str) -> pd.DataFrame:
     """Load and inspect the travel dataset."""
-    df = pd.read_csv(filepath)
+    # Own frame holding only the ranker's columns; the shared cached one stays untouched
+    full = load(filepath)
+    df = pd.DataFrame({col: full[col] for col in full.columns if col in DATASET_COLUMNS})
     print(f"Dataset loaded: {len(df)} destinations")
-    print(f"Columns: {list(df.columns)}")
+    print(f"Columns: {list(full.columns)}")
+    # Lowercased city lookup key, computed once instead of on every query
+    df['_city_lower'] = df['City'].str.lower().astype('category')
     return df
 
+def _city_key(df: pd.DataFrame) -> pd.Series:
+    """Lowercased city per row; frames from load_dataset carry it precomputed."""
+    if '_city_lower' in df.columns:
+        return df['_city_lower']
+    return df['City'].str.lower()
+
+def _as_categorical(column: pd.Series) -> pd.Series:
+    """Return the column as a categorical, converting only if it is not one already."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column
+    return column.astype('category')
+
 def get_state_from_city(df: pd.DataFrame, city: str) -> str:
     """Extract state for a given city from dataset."""
-    city_data = df[df['City'].str.lower() == city.lower()]
-    if not city_data.empty:
-        return city_data.iloc[0]['State']
+    # Resolved against this frame (an integer-code comparison for load_dataset frames),
+    # then the first listing wins
+    matches = np.flatnonzero((_city_key(df) == city.lower()).to_numpy())
+    if matches.size:
+        return df['State'].iloc[matches[0]]
     return None
 
 def calculate_proximity_weight(source_state: str, dest_state: str) -> float:
@@ -63,96 +92,156 @@ def calculate_proximity_weight(source_state: str, dest_state: str) -> float:
     if source_state == dest_state:
         return 1.0
     
-    neighbors = STATE_NEIGHBORS.get(source_state, [])
+    neighbors = STATE_NEIGHBORS.get(source_state, frozenset())
     if dest_state in neighbors:
         return 0.7
     
     return 0.4
 
 
-def normalize_column(series: pd.Series) -> pd.Series:
-    """Normalize a numeric column to 0-1 range."""
-    min_val = series.min()
-    max_val = series.max()
+def normalize_column(series: pd.Series) -> np.ndarray:
+    """Normalize a numeric column to 0-1 range (float32 array, missing values stay NaN)."""
+    values = series.to_numpy(dtype=np.float32)
+    if values.size == 0 or np.isnan(values).all():
+        return values
+    min_val = np.nanmin(values)
+    max_val = np.nanmax(values)
     if max_val == min_val:
-        return pd.Series([0.5] * len(series), index=series.index)
-    return (series - min_val) / (max_val - min_val)
+        return np.full_like(values, 0.5)
+    return (values - min_val) * (np.float32(1.0) / (max_val - min_val))
 
-def calculate_weekend_score(df: pd.DataFrame, source_city: str) -> pd.DataFrame:
+def _weights_by_code(column: pd.Series, weights: dict, default: float) -> np.ndarray:
+    """Look up a weight per row of a categorical column via its integer codes."""
+    # One entry per category plus a trailing default, which missing values (code -1) pick up
+    table = np.array([weights.get(cat, default) for cat in column.cat.categories] + [default])
+    return table[column.cat.codes.to_numpy()]
+
+def calculate_weekend_score(df: pd.DataFrame, source_city: str, source_state: str = None) -> pd.DataFrame:
     """
     Calculate weekend suitability score using only dataset fields.
+    Pass source_state if it is already known to skip looking it up again.
     
     Score Components:
     - Rating/Popularity (50%): Higher rated places prioritized
     - Geographic Proximity (30%): State-level approximation
     - Category Suitability (20%): Weekend-friendly destination types
     """
-    source_state = get_state_from_city(df, source_city)
+    if source_state is None:
+        source_state = get_state_from_city(df, source_city)
     if not source_state:
         raise ValueError(f"City '{source_city}' not found in dataset")
     
-    # Remove source city destinations
-    df_filtered = df[df['City'].str.lower() != source_city.lower()].copy()
+    # Remove source city destinations, carrying over only the dataset columns
+    # (plus a precomputed rating_score) instead of copying the whole frame
+    mask = (_city_key(df) != source_city.lower()).to_numpy()
+    keep = [col for col in [*DATASET_COLUMNS, 'rating_score'] if col in df.columns]
+    df_filtered = pd.DataFrame({col: df[col][mask] for col in keep})
+    
+    n = len(df_filtered)
     
-    # Use 'Google review rating' column
+    # Use 'Google review rating' column, unless the caller already normalized it
     rating_col = 'Google review rating'
-    if rating_col in df_filtered.columns and pd.api.types.is_numeric_dtype(df_filtered[rating_col]):
-        df_filtered['rating_score'] = normalize_column(df_filtered[rating_col])
+    if 'rating_score' in df_filtered.columns:
+        rating = df_filtered['rating_score'].to_numpy()
+    elif rating_col in df_filtered.columns and pd.api.types.is_numeric_dtype(df_filtered[rating_col]):
+        rating = normalize_column(df_filtered[rating_col])
     else:
-        df_filtered['rating_score'] = 0.5  # Neutral if no rating
+        rating = np.full(n, 0.5)  # Neutral if no rating
     
     # Calculate proximity score (30% weight)
-    df_filtered['proximity_score'] = df_filtered['State'].apply(
-        lambda x: calculate_proximity_weight(source_state, x)
-    )
+    # Weight each distinct state once; a missing state counts as any unlisted state
+    states = _as_categorical(df_filtered['State'])
+    proximity_map = {
+        state: calculate_proximity_weight(source_state, state)
+        for state in states.cat.categories
+    }
+    proximity = _weights_by_code(
+        states, proximity_map, calculate_proximity_weight(source_state, None)
+    ).astype(np.float32)
     
     # Calculate category score (20% weight)
     if 'Type' in df_filtered.columns:
-        df_filtered['category_score'] = df_filtered['Type'].apply(
-            lambda x: max([WEEKEND_CATEGORIES.get(cat, 0.5) for cat in str(x).split(',')], default=0.5)
-        )
+        # Score each distinct Type label once (best of its comma-separated
+        # categories), then broadcast to destinations through the category codes
+        types = _as_categorical(df_filtered['Type'])
+        type_labels = types.cat.categories
+        parts = pd.Series(type_labels).astype(str).str.split(',').explode().str.strip()
+        best = parts.map(WEEKEND_CATEGORIES).fillna(0.5).groupby(level=0).max()
+        type_weights = dict(zip(type_labels, best))
+        category = _weights_by_code(types, type_weights, 0.5)
     else:
-        df_filtered['category_score'] = 0.5
+        category = np.full(n, 0.5)
     
-    # Composite weekend score
-    df_filtered['weekend_score'] = (
-        0.5 * df_filtered['rating_score'] +
-        0.3 * df_filtered['proximity_score'] +
-        0.2 * df_filtered['category_score']
+    # Composite weekend score; all four columns are attached in one assign
+    df_filtered = df_filtered.assign(
+        rating_score=rating,
+        proximity_score=proximity,
+        category_score=category,
+        weekend_score=0.5 * rating + 0.3 * proximity + 0.2 * category,
     )
     
     return df_filtered
 
-def get_top_destinations(df: pd.DataFrame, source_city: str, top_n: int = 5) -> pd.DataFrame:
+def get_top_destinations(df: pd.DataFrame, source_city: str, top_n: int = 5,
+                         source_state: str = None) -> pd.DataFrame:
     """Get top N weekend destinations from source city."""
-    scored_df = calculate_weekend_score(df, source_city)
-    top_destinations = scored_df.nlargest(top_n, 'weekend_score')
+    scored_df = calculate_weekend_score(df, source_city, source_state)
+    # Missing scores rank last, as with nlargest
+    scores = np.nan_to_num(scored_df['weekend_score'].to_numpy(dtype=float), nan=-np.inf)
+    candidates = np.arange(len(scores))
+    if 0 < top_n < len(scores):
+        # Partial selection: only rows scoring at least the top_n-th best survive
+        kth = len(scores) - top_n
+        cutoff = np.partition(scores, kth)[kth]
+        candidates = np.flatnonzero(scores >= cutoff)
+    # Stable sort keeps tied rows in dataset order, matching nlargest(keep='first')
+    order = candidates[np.argsort(-scores[candidates], kind='stable')][:max(top_n, 0)]
+    top_destinations = scored_df.iloc[order]
     return top_destinations
 
-def format_output(df: pd.DataFrame, source_city: str, top_destinations: pd.DataFrame) -> str:
+def format_output(df: pd.DataFrame, source_city: str, top_destinations: pd.DataFrame,
+                  source_state: str = None) -> str:
     """Format results as readable text."""
-    source_state = get_state_from_city(df, source_city)
+    if source_state is None:
+        source_state = get_state_from_city(df, source_city)
     
-    output = f"{'='*70}\n"
-    output += f"TOP 5 WEEKEND GETAWAYS FROM {source_city.upper()}\n"
-    output += f"{'='*70}\n\n"
-    output += f"Source: {source_city}, {source_state}\n"
-    output += f"Ranking based on: Rating (50%), Proximity (30%), Category (20%)\n\n"
+    parts = [
+        f"{'='*70}\n",
+        f"TOP 5 WEEKEND GETAWAYS FROM {source_city.upper()}\n",
+        f"{'='*70}\n\n",
+        f"Source: {source_city}, {source_state}\n",
+        f"Ranking based on: Rating (50%), Proximity (30%), Category (20%)\n\n",
+    ]
     
-    for idx, (_, row) in enumerate(top_destinations.iterrows(), 1):
-        output += f"{idx}. {row.get('Name', 'N/A')}\n"
-        output += f"   Location: {row['City']}, {row['State']}\n"
+    # Pull each column out once rather than boxing every row into a Series
+    n = len(top_destinations)
+    names = top_destinations['Name'].to_numpy() if 'Name' in top_destinations else ['N/A'] * n
+    cities = top_destinations['City'].to_numpy()
+    states = top_destinations['State'].to_numpy()
+    types = top_destinations['Type'].to_numpy() if 'Type' in top_destinations else None
+    ratings = (
+        top_destinations['Google review rating'].to_numpy()
+        if 'Google review rating' in top_destinations else None
+    )
+    weekend_scores = top_destinations['weekend_score'].to_numpy()
+    proximity_scores = top_destinations['proximity_score'].to_numpy()
+    rating_scores = top_destinations['rating_score'].to_numpy()
+    category_scores = top_destinations['category_score'].to_numpy()
+    
+    for i in range(n):
+        parts.append(f"{i + 1}. {names[i]}\n")
+        parts.append(f"   Location: {cities[i]}, {states[i]}\n")
         
-        if 'Type' in row:
-            output += f"   Category: {row['Type']}\n"
+        if types is not None:
+            parts.append(f"   Category: {types[i]}\n")
         
-        if 'Google review rating' in row:
-            output += f"   Rating: {row['Google review rating']}\n"
+        if ratings is not None:
+            parts.append(f"   Rating: {ratings[i]}\n")
         
-        output += f"   Weekend Score: {row['weekend_score']:.3f}\n"
-        output += f"   (Proximity: {row['proximity_score']:.1f}, Rating: {row['rating_score']:.2f}, Category: {row['category_score']:.2f})\n\n"
+        parts.append(f"   Weekend Score: {weekend_scores[i]:.3f}\n")
+        parts.append(f"   (Proximity: {proximity_scores[i]:.1f}, Rating: {rating_scores[i]:.2f}, Category: {category_scores[i]:.2f})\n\n")
     
-    return output
+    return ''.join(parts)
 
 def save_output(content: str, filename: str):
     """Save output to sample_outputs directory."""
@@ -175,14 +264,22 @@ def main():
     # Load dataset
     df = load_dataset(dataset_path)
     
+    # Rating normalization does not depend on the source city, so do it once;
+    # without a numeric rating, calculate_weekend_score falls back to a neutral score
+    rating_col = 'Google review rating'
+    if rating_col in df.columns and rating_col in numeric_columns(dataset_path):
+        df['rating_score'] = normalize_column(df[rating_col])
+    
     # Generate rankings for three major cities
     cities = df.sample(3)['City'].tolist()
     
     for city in cities:
         try:
             print(f"\nProcessing {city}...")
-            top_destinations = get_top_destinations(df, city, top_n=5)
-            output = format_output(df, city, top_destinations)
+            # Resolve the source state once and share it between scoring and formatting
+            source_state = get_state_from_city(df, city)
+            top_destinations = get_top_destinations(df, city, top_n=5, source_state=source_state)
+            output = format_output(df, city, top_destinations, source_state=source_state)
             
             # Display to console
             print(output)